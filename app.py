@@ -2,19 +2,149 @@
 Main Streamlit application for neuroblastoma HSP90 inhibitor simulation.
 """
 
+import functools
+import threading
+import numba
 import streamlit as st
 import numpy as np
 from src.models.tumor_model import TumorModel
 from src.models.drug_model import DrugModel
 from src.models.pathways import ProteinStabilityModel
-from src.ui.dashboard import render_sidebar_controls, render_main_dashboard
-from src.utils.parameters import DEFAULT_TIME_STEP
+from src.models.subtypes import TumorSubtype
+from src.models.sweep_core import simulate_batch
+from src.ui.dashboard import (
+    render_sidebar_controls,
+    render_main_dashboard,
+    render_sweep_controls,
+    render_sweep_results
+)
+from src.utils.parameters import (
+    DEFAULT_TIME_STEP,
+    HILL_COEFFICIENT,
+    E_MAX,
+    APOPTOSIS_DELAY,
+    APOPTOSIS_MULTIPLIER,
+    PKParams
+)
 
 
+# Results kept per cached function; each cached simulation holds around
+# a megabyte of arrays
+_CACHE_MAX_ENTRIES = 32
+
+# Hash subtypes by the values the simulation reads from them
+_SUBTYPE_HASH_FUNCS = {
+    TumorSubtype: lambda s: (s.name, s.dependency, s.growth_rate)
+}
+
+# Results kept in float64 rather than downcast for display
+_FULL_PRECISION_RESULTS = ('time_days', 'time_hours', 'volumes')
+
+# Streamlit runs each session in its own thread. After a parallel launch
+# from a non-main thread the TBB threading layer keeps the interpreter from
+# exiting, so prefer OpenMP or workqueue. Those layers are not thread-safe:
+# workqueue (also selectable via NUMBA_THREADING_LAYER) aborts on concurrent
+# launches, so batch simulations run one at a time under the lock.
+numba.config.THREADING_LAYER_PRIORITY = ['omp', 'workqueue', 'tbb']
+_SWEEP_LOCK = threading.Lock()
+
+
+def make_time_grid(duration_days: float, time_step_hours: float) -> np.ndarray:
+    """
+    Generate uniformly spaced simulation time points.
+    
+    Args:
+        duration_days: Simulation duration in days
+        time_step_hours: Time step size in hours
+        
+    Returns:
+        Time points in hours, spaced exactly time_step_hours apart
+    """
+    num_steps = int(round(duration_days * 24.0 / time_step_hours))
+    return np.arange(num_steps, dtype=np.float64) * time_step_hours
+
+
+@functools.lru_cache(maxsize=64)
+def compute_concentrations(
+    pk_params: PKParams,
+    dose: float,
+    dosing_interval: float,
+    duration_days: float,
+    time_step_hours: float
+) -> np.ndarray:
+    """
+    Calculate the drug concentration time course for a dosing regimen.
+    
+    Memoized per regimen, so runs that only change tumor parameters reuse
+    the PK curve. The returned array is shared between callers and is
+    read-only; arguments should be builtin floats to keep cache keys stable.
+    
+    Args:
+        pk_params: Drug pharmacokinetic parameters
+        dose: Dose amount in nM
+        dosing_interval: Dosing interval in hours
+        duration_days: Simulation duration in days
+        time_step_hours: Time step size in hours
+        
+    Returns:
+        Drug concentration (nM) at each time point of make_time_grid
+    """
+    drug = DrugModel(pk_params)
+    time_hours = make_time_grid(duration_days, time_step_hours)
+    
+    dosing_times = drug.generate_dosing_schedule(
+        start_time=0.0,
+        end_time=time_hours[-1],
+        interval_hours=dosing_interval
+    )
+    concentrations = drug.calculate_concentration_series(
+        time_hours=time_hours,
+        dose=dose,
+        dosing_times=dosing_times
+    )
+    concentrations.flags.writeable = False
+    
+    return concentrations
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_MAX_ENTRIES)
+def compute_protein_levels(
+    drug_effects: np.ndarray,
+    time_step_hours: float
+) -> dict:
+    """
+    Calculate protein stability levels for a drug effect time course.
+    
+    Memoized on the array contents, so runs that only change parameters
+    which do not affect the drug effect (e.g. initial volume) reuse the
+    protein results.
+    
+    Args:
+        drug_effects: Drug effect at each time point
+        time_step_hours: Spacing between time points in hours
+        
+    Returns:
+        Dictionary mapping protein names to stability levels over time
+    """
+    protein_model = ProteinStabilityModel()
+    return protein_model.calculate_protein_levels(
+        drug_effects=drug_effects,
+        time_step_hours=time_step_hours
+    )
+
+
+@st.cache_data(
+    show_spinner=False,
+    max_entries=_CACHE_MAX_ENTRIES,
+    hash_funcs=_SUBTYPE_HASH_FUNCS
+)
 def run_simulation(parameters: dict) -> dict:
     """
     Run the complete simulation.
     
+    Results are memoized on the parameter values, so re-running with
+    unchanged parameters returns immediately.
+    
     Args:
         parameters: Dictionary with simulation parameters
         
@@ -32,75 +162,40 @@ def run_simulation(parameters: dict) -> dict:
         tumor.dependency = parameters['dependency']
     
     drug = DrugModel(parameters['drug_pk'])
-    protein_model = ProteinStabilityModel()
     
     # Simulation parameters
-    duration_days = parameters['duration_days']
     time_step_hours = parameters['time_step_hours']
     time_step_days = time_step_hours / 24.0
     
     # Generate time points
-    num_steps = int(duration_days / time_step_days)
-    time_days = np.linspace(0, duration_days, num_steps)
-    time_hours = time_days * 24.0
+    time_hours = make_time_grid(parameters['duration_days'], time_step_hours)
     
-    # Generate dosing schedule
-    dosing_times = drug.generate_dosing_schedule(
-        start_time=0.0,
-        end_time=time_hours[-1],
-        interval_hours=parameters['dosing_interval']
+    # Calculate drug concentration and effect for the whole time course at once
+    concentrations = compute_concentrations(
+        parameters['drug_pk'],
+        float(parameters['dose']),
+        float(parameters['dosing_interval']),
+        float(parameters['duration_days']),
+        float(time_step_hours)
+    )
+    drug_effects = drug.calculate_effect_array(
+        concentrations=concentrations,
+        dependency=tumor.dependency
     )
     
-    # Initialize result arrays
-    volumes = []
-    concentrations = []
-    drug_effects = []
-    growth_rates = []
-    apoptosis_rates = []
-    
-    # Run simulation
-    for i, t_hours in enumerate(time_hours):
-        t_days = time_days[i]
-        
-        # Calculate drug concentration
-        concentration = drug.calculate_concentration(
-            time_hours=t_hours,
-            dose=parameters['dose'],
-            dosing_times=dosing_times
-        )
-        concentrations.append(concentration)
-        
-        # Calculate drug effect
-        effect = drug.calculate_effect(
-            concentration=concentration,
-            dependency=tumor.dependency
-        )
-        drug_effects.append(effect)
-        
-        # Update tumor
-        current_volume = tumor.update(
-            drug_effect=effect,
-            time_hours=t_hours,
-            time_step_days=time_step_days
-        )
-        volumes.append(current_volume)
-        
-        # Record rates
-        growth = tumor.calculate_growth_rate(effect)
-        apoptosis = tumor.calculate_apoptosis_rate(effect, t_hours)
-        growth_rates.append(growth)
-        apoptosis_rates.append(apoptosis)
-    
-    # Calculate protein stability levels
-    protein_levels = protein_model.calculate_protein_levels(
-        time_hours=time_hours[-1],
+    # Run tumor simulation
+    volumes, growth_rates, apoptosis_rates = tumor.simulate(
         drug_effects=drug_effects,
-        time_points=time_hours.tolist()
+        time_hours=time_hours,
+        time_step_days=time_step_days
     )
     
-    return {
-        'time_days': time_days.tolist(),
-        'time_hours': time_hours.tolist(),
+    # Calculate protein stability levels
+    protein_levels = compute_protein_levels(drug_effects, time_step_hours)
+    
+    results = {
+        'time_days': time_hours / 24.0,
+        'time_hours': time_hours,
         'volumes': volumes,
         'concentrations': concentrations,
         'drug_effects': drug_effects,
@@ -108,6 +203,90 @@ def run_simulation(parameters: dict) -> dict:
         'growth_rates': growth_rates,
         'apoptosis_rates': apoptosis_rates
     }
+    
+    # Integration runs in float64; float32 is plenty for display and halves
+    # the data sent to the browser. Time and volume stay float64 because the
+    # dashboard differentiates them for the volume change rate, and the
+    # plotting layer quantizes them itself.
+    results['protein_levels'] = {
+        protein: np.asarray(levels, dtype=np.float32)
+        for protein, levels in protein_levels.items()
+    }
+    return {
+        key: (
+            value.astype(np.float32)
+            if isinstance(value, np.ndarray) and key not in _FULL_PRECISION_RESULTS
+            else value
+        )
+        for key, value in results.items()
+    }
+
+
+@st.cache_data(
+    show_spinner=False,
+    max_entries=_CACHE_MAX_ENTRIES,
+    hash_funcs=_SUBTYPE_HASH_FUNCS
+)
+def run_sweep(parameters: dict, doses: tuple, intervals: tuple) -> dict:
+    """
+    Run the tumor simulation over a grid of doses and dosing intervals.
+    
+    All regimens share the subtype, drug and time settings in parameters
+    and are simulated in parallel.
+    
+    Args:
+        parameters: Dictionary with simulation parameters
+        doses: Doses to sweep (nM)
+        intervals: Dosing intervals to sweep (hours)
+        
+    Returns:
+        Dictionary with the swept doses and intervals and the final tumor
+        volume (cells) for each, shaped (len(doses), len(intervals))
+    """
+    tumor = TumorModel(
+        subtype=parameters['subtype'],
+        initial_volume=parameters['initial_volume']
+    )
+    if 'dependency' in parameters:
+        tumor.dependency = parameters['dependency']
+    drug = DrugModel(parameters['drug_pk'])
+    
+    time_step_days = parameters['time_step_hours'] / 24.0
+    time_hours = make_time_grid(
+        parameters['duration_days'],
+        parameters['time_step_hours']
+    )
+    
+    dose_grid, interval_grid = np.meshgrid(
+        np.asarray(doses, dtype=float),
+        np.asarray(intervals, dtype=float),
+        indexing='ij'
+    )
+    with _SWEEP_LOCK:
+        volumes = simulate_batch(
+            dose_grid.ravel(),
+            interval_grid.ravel(),
+            time_hours,
+            time_step_days,
+            float(drug.peak_time),
+            float(drug.elimination_rate),
+            float(drug.ic50),
+            float(HILL_COEFFICIENT),
+            float(E_MAX),
+            float(tumor.volume),
+            float(tumor.carrying_capacity),
+            float(tumor.growth_rate),
+            float(tumor.base_apoptosis),
+            float(tumor.dependency),
+            float(APOPTOSIS_MULTIPLIER),
+            float(APOPTOSIS_DELAY)
+        )
+    
+    return {
+        'doses': np.asarray(doses, dtype=float),
+        'intervals': np.asarray(intervals, dtype=float),
+        'final_volumes': volumes[:, -1].reshape(dose_grid.shape)
+    }
 
 
 def main():
@@ -130,43 +309,64 @@ def main():
             st.session_state['results'] = results
             st.session_state['parameters'] = parameters
     
-    # Display results if available
-    if 'results' in st.session_state:
-        # Toggle for protein stability
-        show_proteins = st.sidebar.checkbox(
-            "Show Protein Stability",
-            value=True,
-            help="Display oncogenic protein stability curves"
-        )
-        
-        render_main_dashboard(
-            **st.session_state['results'],
-            parameters=st.session_state['parameters'],
-            show_protein_stability=show_proteins
-        )
-    else:
-        # Welcome screen
-        st.title("Neuroblastoma HSP90 Inhibitor Therapy Simulation")
-        st.markdown("""
-        ### Welcome to the Neuroblastoma Digital Twin Simulation
-        
-        This tool simulates how different neuroblastoma tumor subtypes respond to 
-        HSP90 inhibitor therapy using real biological parameters from published literature.
-        
-        **To get started:**
-        1. Adjust simulation parameters in the sidebar
-        2. Select tumor subtype and drug
-        3. Click "Run Simulation" to see results
+    tab_simulation, tab_sweep = st.tabs(["Simulation", "Parameter Sweep"])
+    
+    with tab_simulation:
+        # Display results if available
+        if 'results' in st.session_state:
+            # Toggle for protein stability
+            show_proteins = st.sidebar.checkbox(
+                "Show Protein Stability",
+                value=True,
+                help="Display oncogenic protein stability curves"
+            )
+            
+            render_main_dashboard(
+                **st.session_state['results'],
+                parameters=st.session_state['parameters'],
+                show_protein_stability=show_proteins
+            )
+        else:
+            # Welcome screen
+            st.title("Neuroblastoma HSP90 Inhibitor Therapy Simulation")
+            st.markdown("""
+            ### Welcome to the Neuroblastoma Digital Twin Simulation
+            
+            This tool simulates how different neuroblastoma tumor subtypes respond to 
+            HSP90 inhibitor therapy using real biological parameters from published literature.
+            
+            **To get started:**
+            1. Adjust simulation parameters in the sidebar
+            2. Select tumor subtype and drug
+            3. Click "Run Simulation" to see results
+            
+            **Features:**
+            - Real biological parameters from literature
+            - Multiple tumor subtypes (MYCN amplified, ALK mutated, ATRX altered, Low risk)
+            - Three HSP90 inhibitors (17-AAG, XL-888, Debio-0932)
+            - Protein stability modeling (MYCN, ALK, AKT, HIF1A)
+            - Interactive visualizations
+            
+            See the README for detailed information about the biological models.
+            """)
+    
+    with tab_sweep:
+        sweep_settings = render_sweep_controls()
         
-        **Features:**
-        - Real biological parameters from literature
-        - Multiple tumor subtypes (MYCN amplified, ALK mutated, ATRX altered, Low risk)
-        - Three HSP90 inhibitors (17-AAG, XL-888, Debio-0932)
-        - Protein stability modeling (MYCN, ALK, AKT, HIF1A)
-        - Interactive visualizations
+        if st.button("Run Sweep", type="primary"):
+            with st.spinner("Running parameter sweep..."):
+                st.session_state['sweep_results'] = run_sweep(
+                    parameters,
+                    sweep_settings['doses'],
+                    sweep_settings['intervals']
+                )
+                st.session_state['sweep_parameters'] = parameters
         
-        See the README for detailed information about the biological models.
-        """)
+        if 'sweep_results' in st.session_state:
+            render_sweep_results(
+                **st.session_state['sweep_results'],
+                parameters=st.session_state['sweep_parameters']
+            )
 
 
 if __name__ == "__main__":
@@ -2,27 +2,36 @@
 HSP90 inhibitor pharmacokinetic and pharmacodynamic models.
 """
 
+import math
 import numpy as np
-from typing import Dict, List
-from src.utils.parameters import HILL_COEFFICIENT, E_MAX
+from typing import List
+from src.utils.parameters import HILL_COEFFICIENT, E_MAX, PKParams
+
+# Time point x dose cells evaluated at once by calculate_concentration_series
+_SERIES_BLOCK_CELLS = 1 << 20
 
 
 class DrugModel:
     """Models HSP90 inhibitor pharmacokinetics and pharmacodynamics."""
     
-    def __init__(self, pk_params: Dict):
+    def __init__(self, pk_params: PKParams):
         """
         Initialize drug model.
         
         Args:
-            pk_params: Dictionary with 'peak_time', 'half_life', 'ic50', 'name'
+            pk_params: Pharmacokinetic parameters (peak_time, half_life, ic50, name)
         """
         self.pk_params = pk_params
-        self.name = pk_params['name']
-        self.peak_time = pk_params['peak_time']  # hours
-        self.half_life = pk_params['half_life']  # hours
-        self.ic50 = pk_params['ic50']  # nM
+        self.name = pk_params.name
+        self.peak_time = pk_params.peak_time  # hours
+        self.half_life = pk_params.half_life  # hours
+        self.ic50 = pk_params.ic50  # nM
         self.elimination_rate = np.log(2) / self.half_life  # per hour
+        self._ic50_h = self.ic50 ** HILL_COEFFICIENT  # Hill equation denominator term
+        
+        # Single-dose response on the last time grid used, keyed by (n, step)
+        self._response_key = None
+        self._response = None
     
     def calculate_concentration(
         self,
@@ -41,6 +50,9 @@ class DrugModel:
         Returns:
             Total concentration from all doses (nM)
         """
+        peak_time = self.peak_time
+        elimination_rate = self.elimination_rate
+        exp = math.exp
         total_concentration = 0.0
         
         for dose_time in dosing_times:
@@ -49,18 +61,132 @@ class DrugModel:
                 time_since_dose = time_hours - dose_time
                 
                 # Peak concentration occurs at peak_time after dose
-                if time_since_dose <= self.peak_time:
+                if time_since_dose <= peak_time:
                     # Rising phase (linear approximation to peak)
-                    c_max = dose * (time_since_dose / self.peak_time)
+                    c_max = dose * (time_since_dose / peak_time)
                 else:
                     # Elimination phase
-                    time_in_elimination = time_since_dose - self.peak_time
-                    c_max = dose * np.exp(-self.elimination_rate * time_in_elimination)
+                    time_in_elimination = time_since_dose - peak_time
+                    c_max = dose * exp(-elimination_rate * time_in_elimination)
                 
                 total_concentration += c_max
         
         return total_concentration
     
+    def calculate_concentration_series(
+        self,
+        time_hours: np.ndarray,
+        dose: float,
+        dosing_times: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate drug concentration at every time point in one vectorized pass.
+        
+        Same one-compartment model as calculate_concentration, evaluated by
+        broadcasting time points against dosing times and summing over doses.
+        
+        Args:
+            time_hours: Array of time points in hours
+            dose: Dose amount in nM
+            dosing_times: Array of dosing times in hours
+            
+        Returns:
+            Array of total concentrations (nM), one per time point
+        """
+        time_hours = np.asarray(time_hours, dtype=float)
+        dosing_times = np.asarray(dosing_times, dtype=float)
+        concentrations = np.empty(len(time_hours))
+        
+        # Work through the time axis in blocks so the (times, doses) matrices
+        # stay bounded for long, finely sampled runs
+        block = max(1, _SERIES_BLOCK_CELLS // max(len(dosing_times), 1))
+        for start in range(0, len(time_hours), block):
+            stop = start + block
+            
+            # Time since each dose, shape (block, n_doses). Doses not yet given
+            # are clamped to zero lag, which the rising phase maps to zero
+            # concentration without evaluating a growing exponential.
+            lag = np.maximum(time_hours[start:stop, None] - dosing_times[None, :], 0.0)
+            
+            # Rising phase (linear approximation to peak), else elimination phase
+            c = np.where(
+                lag <= self.peak_time,
+                dose * lag / self.peak_time,
+                dose * np.exp(
+                    -self.elimination_rate * np.maximum(lag - self.peak_time, 0.0)
+                )
+            )
+            concentrations[start:stop] = c.sum(axis=1)
+        
+        return concentrations
+    
+    def calculate_concentration_fft(
+        self,
+        time_hours: np.ndarray,
+        dose: float,
+        dosing_times: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate drug concentration at every time point by FFT convolution.
+        
+        Uses linear superposition: the single-dose response is convolved with
+        a dosing impulse train, which is O(N log N) rather than O(N * doses).
+        Assumes a uniform time grid; dosing times are snapped to the nearest
+        grid point, so results match calculate_concentration_series exactly
+        only when doses fall on the grid.
+        
+        Args:
+            time_hours: Array of uniformly spaced time points in hours
+            dose: Dose amount in nM
+            dosing_times: Array of dosing times in hours
+            
+        Returns:
+            Array of total concentrations (nM), one per time point
+        """
+        time_hours = np.asarray(time_hours, dtype=float)
+        n = len(time_hours)
+        if n == 0:
+            return np.zeros(0)
+        step = time_hours[1] - time_hours[0] if n > 1 else 1.0
+        
+        # Dosing impulse train on the time grid
+        dose_indices = np.rint(
+            (np.asarray(dosing_times, dtype=float) - time_hours[0]) / step
+        ).astype(int)
+        dose_indices = dose_indices[(dose_indices >= 0) & (dose_indices < n)]
+        impulse = np.bincount(dose_indices, minlength=n) * dose
+        
+        # Single unit-dose response sampled on the same grid
+        response = self._single_dose_response(n, step)
+        
+        # Linear convolution via zero-padded real FFT
+        n_fft = 1 << (2 * n - 1).bit_length()
+        spectrum = np.fft.rfft(impulse, n_fft) * np.fft.rfft(response, n_fft)
+        return np.fft.irfft(spectrum, n_fft)[:n]
+    
+    def _single_dose_response(self, n: int, step: float) -> np.ndarray:
+        """
+        Unit-dose concentration response on a uniform grid, cached per grid.
+        
+        Args:
+            n: Number of grid points
+            step: Grid spacing in hours
+            
+        Returns:
+            Concentration (per nM dosed) at lags 0, step, ..., (n - 1) * step
+        """
+        key = (n, float(step))
+        if key != self._response_key:
+            lag = np.arange(n, dtype=float) * step
+            self._response = np.where(
+                lag <= self.peak_time,
+                lag / self.peak_time,
+                np.exp(-self.elimination_rate * (lag - self.peak_time))
+            )
+            self._response_key = key
+        
+        return self._response
+    
     def calculate_effect(
         self,
         concentration: float,
@@ -80,11 +206,35 @@ class DrugModel:
             return 0.0
         
         # Hill equation: E = Emax * C^h / (C^h + IC50^h)
-        h = HILL_COEFFICIENT
-        c_h = concentration ** h
-        ic50_h = self.ic50 ** h
+        c_h = concentration ** HILL_COEFFICIENT
         
-        effect = E_MAX * c_h / (c_h + ic50_h)
+        effect = E_MAX * c_h / (c_h + self._ic50_h)
+        
+        # Scale by dependency
+        return effect * dependency
+    
+    def calculate_effect_array(
+        self,
+        concentrations: np.ndarray,
+        dependency: float
+    ) -> np.ndarray:
+        """
+        Calculate drug effect for an array of concentrations using Hill equation.
+        
+        Args:
+            concentrations: Drug concentrations (nM)
+            dependency: Tumor HSP90 dependency (0-1)
+            
+        Returns:
+            Array of effect magnitudes (0-1), scaled by dependency
+        """
+        c = np.asarray(concentrations, dtype=float)
+        positive = c > 0
+        
+        # Hill equation: E = Emax * C^h / (C^h + IC50^h)
+        c_h = np.power(np.where(positive, c, 0.0), HILL_COEFFICIENT)
+        
+        effect = np.where(positive, E_MAX * c_h / (c_h + self._ic50_h), 0.0)
         
         # Scale by dependency
         return effect * dependency
@@ -94,24 +244,20 @@ class DrugModel:
         start_time: float,
         end_time: float,
         interval_hours: float
-    ) -> List[float]:
+    ) -> np.ndarray:
         """
         Generate dosing schedule.
         
+        Dose times are computed as start_time + k * interval_hours rather than
+        by repeated addition, so long horizons do not drift.
+        
         Args:
             start_time: Start time in hours
             end_time: End time in hours
             interval_hours: Dosing interval in hours
             
         Returns:
-            List of dosing times in hours
+            Array of dosing times in hours
         """
-        dosing_times = []
-        current_time = start_time
-        
-        while current_time <= end_time:
-            dosing_times.append(current_time)
-            current_time += interval_hours
-        
-        return dosing_times
-
+        num_doses = max(0, int(np.floor((end_time - start_time) / interval_hours)) + 1)
+        return start_time + interval_hours * np.arange(num_doses, dtype=float)
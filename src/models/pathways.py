@@ -2,12 +2,15 @@
 Oncogenic client protein stability models under HSP90 inhibition.
 """
 
+import math
 import numpy as np
-from typing import Dict, List
+from typing import Dict
 from src.utils.parameters import (
     PROTEIN_HALF_LIVES_BASELINE,
-    PROTEIN_HALF_LIVES_INHIBITED
+    PROTEIN_HALF_LIVES_INHIBITED,
+    PROTEIN_ORDER
 )
+from src.models.pathways_core import integrate_proteins
 
 
 class ProteinStabilityModel:
@@ -15,9 +18,13 @@ class ProteinStabilityModel:
     
     def __init__(self):
         """Initialize with baseline half-lives."""
-        self.baseline_half_lives = PROTEIN_HALF_LIVES_BASELINE.copy()
-        self.inhibited_half_lives = PROTEIN_HALF_LIVES_INHIBITED.copy()
-        self.proteins = list(self.baseline_half_lives.keys())
+        self.baseline_half_lives = PROTEIN_HALF_LIVES_BASELINE._asdict()
+        self.inhibited_half_lives = PROTEIN_HALF_LIVES_INHIBITED._asdict()
+        self.proteins = list(PROTEIN_ORDER)
+        
+        # Per-protein constants in PROTEIN_ORDER
+        self._baseline = np.array(PROTEIN_HALF_LIVES_BASELINE, dtype=float)
+        self._inhibited = np.array(PROTEIN_HALF_LIVES_INHIBITED, dtype=float)
     
     def calculate_stability(
         self,
@@ -41,9 +48,9 @@ class ProteinStabilityModel:
         if half_life_minutes <= 0:
             return 0.0
         
-        decay_constant = np.log(2) / half_life_minutes
-        stability = initial_stability * np.exp(-time_minutes * decay_constant)
-        return max(0.0, stability)
+        decay_constant = math.log(2) / half_life_minutes
+        stability = initial_stability * math.exp(-time_minutes * decay_constant)
+        return stability if stability > 0.0 else 0.0
     
     def get_effective_half_life(
         self,
@@ -65,14 +72,13 @@ class ProteinStabilityModel:
         
         # Interpolate between baseline and inhibited based on drug effect
         effective = baseline - (baseline - inhibited) * drug_effect
-        return max(inhibited, effective)
+        return effective if effective > inhibited else inhibited
     
     def calculate_protein_levels(
         self,
-        time_hours: float,
-        drug_effects: List[float],
-        time_points: List[float]
-    ) -> Dict[str, List[float]]:
+        drug_effects: np.ndarray,
+        time_step_hours: float
+    ) -> Dict[str, np.ndarray]:
         """
         Calculate protein stability over time with dynamic drug effects.
         
@@ -80,62 +86,20 @@ class ProteinStabilityModel:
         Protein levels represent relative stability/degradation rate.
         
         Args:
-            time_hours: Current simulation time in hours
-            drug_effects: List of drug effects at each time point
-            time_points: List of time points in hours
+            drug_effects: Drug effect at each time point
+            time_step_hours: Spacing between time points in hours
             
         Returns:
-            Dictionary mapping protein names to stability levels over time
+            Dictionary mapping protein names to stability level arrays over time
         """
-        protein_levels = {protein: [] for protein in self.proteins}
-        
-        # Initialize protein levels at steady state (synthesis = degradation)
-        current_levels = {protein: 1.0 for protein in self.proteins}
-        
-        for i, t in enumerate(time_points):
-            if t > time_hours:
-                break
-            
-            # Get current drug effect
-            if i < len(drug_effects):
-                effect = drug_effects[i]
-            else:
-                effect = drug_effects[-1] if drug_effects else 0.0
-            
-            # Calculate new levels for each protein
-            for protein in self.proteins:
-                # Get baseline and effective half-lives
-                baseline_half_life = self.baseline_half_lives[protein]
-                half_life = self.get_effective_half_life(protein, effect)
-                
-                # Calculate time step in minutes
-                if i > 0:
-                    dt_minutes = (t - time_points[i-1]) * 60
-                else:
-                    dt_minutes = 0.0
-                
-                if dt_minutes > 0:
-                    # Decay constant
-                    decay_constant = np.log(2) / half_life
-                    
-                    # Synthesis rate (assumed constant, balances baseline degradation)
-                    baseline_decay = np.log(2) / baseline_half_life
-                    synthesis_rate = baseline_decay  # Maintains steady state at baseline
-                    
-                    # Update protein level: synthesis - degradation
-                    # dP/dt = synthesis - decay * P
-                    # Simplified Euler step
-                    current_level = current_levels[protein]
-                    dP = (synthesis_rate - decay_constant * current_level) * dt_minutes
-                    current_level = max(0.0, current_level + dP)
-                    current_levels[protein] = current_level
-                
-                # Store relative stability (normalized to show degradation rate effect)
-                # Higher value = more stable = slower degradation
-                stability_ratio = half_life / baseline_half_life
-                relative_stability = current_levels[protein] * stability_ratio
-                
-                protein_levels[protein].append(relative_stability)
+        levels_over_time = integrate_proteins(
+            np.ascontiguousarray(drug_effects, dtype=float),
+            float(time_step_hours) * 60.0,
+            self._baseline,
+            self._inhibited
+        )
         
-        return protein_levels
-
+        return {
+            protein: levels_over_time[:, j]
+            for j, protein in enumerate(self.proteins)
+        }
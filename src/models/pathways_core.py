@@ -0,0 +1,90 @@
+"""
+Compiled protein stability integrator.
+"""
+
+import math
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def step_proteins(
+    levels: np.ndarray,
+    steady_state: np.ndarray,
+    decay: np.ndarray,
+    dt: float
+) -> None:
+    """
+    Advance protein levels in place by one time step.
+
+    Solves dP/dt = synthesis - decay * P exactly over the step:
+    P(t + dt) = P_ss + (P - P_ss) * exp(-decay * dt)
+
+    Args:
+        levels: Current level per protein, updated in place
+        steady_state: Steady-state level (synthesis / decay) per protein
+        decay: Degradation rate constant per protein (per minute)
+        dt: Step size in minutes
+    """
+    for j in range(levels.shape[0]):
+        levels[j] = steady_state[j] + (levels[j] - steady_state[j]) * math.exp(
+            -decay[j] * dt
+        )
+
+
+@njit(cache=True, fastmath=True)
+def integrate_proteins(
+    drug_effects: np.ndarray,
+    time_step_minutes: float,
+    baseline_half_lives: np.ndarray,
+    inhibited_half_lives: np.ndarray
+) -> np.ndarray:
+    """
+    Integrate protein levels with synthesis and degradation over time.
+
+    Same model as ProteinStabilityModel.calculate_protein_levels, compiled
+    to a single native loop over time points and proteins.
+
+    Args:
+        drug_effects: Drug effect (0-1) at each uniformly spaced time point
+        time_step_minutes: Spacing between time points in minutes
+        baseline_half_lives: Baseline half-life per protein in minutes
+        inhibited_half_lives: Inhibited half-life per protein in minutes
+
+    Returns:
+        Relative stability array of shape (n_time_points, n_proteins)
+    """
+    n = len(drug_effects)
+    m = len(baseline_half_lives)
+    out = np.empty((n, m))
+    ln2 = np.log(2.0)
+
+    # Initialize protein levels at steady state (synthesis = degradation)
+    levels = np.ones(m)
+    ratios = np.empty(m)
+    decay = np.empty(m)
+
+    for i in range(n):
+        effect = drug_effects[i]
+
+        for j in range(m):
+            baseline = baseline_half_lives[j]
+            inhibited = inhibited_half_lives[j]
+
+            # Interpolate between baseline and inhibited based on drug effect
+            half_life = baseline - (baseline - inhibited) * effect
+            if half_life < inhibited:
+                half_life = inhibited
+
+            # Synthesis balances baseline degradation, so the steady state
+            # synthesis / decay reduces to half_life / baseline
+            ratios[j] = half_life / baseline
+            decay[j] = ln2 / half_life
+
+        if i > 0:
+            step_proteins(levels, ratios, decay, time_step_minutes)
+
+        for j in range(m):
+            out[i, j] = levels[j] * ratios[j]
+
+    return out
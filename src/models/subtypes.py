@@ -2,15 +2,20 @@
 Neuroblastoma tumor subtype definitions with biological parameters.
 """
 
-from typing import Dict
+import numpy as np
+from typing import Dict, Sequence
 from src.utils.parameters import (
     DEPENDENCY_HIGH_MYCN,
     DEPENDENCY_ALK_MUTATED,
     DEPENDENCY_ATRX_ALTERED,
     DEPENDENCY_LOW_RISK,
-    BASELINE_GROWTH_RATE
+    BASELINE_GROWTH_RATE,
+    PROTEIN_ORDER
 )
 
+# Protein pathway order for TumorSubtype.pathway_weights
+PATHWAY_ORDER = PROTEIN_ORDER
+
 
 class TumorSubtype:
     """Represents a neuroblastoma tumor subtype with specific characteristics."""
@@ -20,7 +25,7 @@ class TumorSubtype:
         name: str,
         dependency: float,
         growth_rate: float,
-        pathway_weights: Dict[str, float]
+        pathway_weights: Sequence[float]
     ):
         """
         Initialize tumor subtype.
@@ -29,12 +34,18 @@ class TumorSubtype:
             name: Subtype name
             dependency: HSP90 dependency multiplier (0-1)
             growth_rate: Baseline growth rate per day
-            pathway_weights: Relative importance of each protein pathway
+            pathway_weights: Relative importance of each protein pathway,
+                in PATHWAY_ORDER
         """
         self.name = name
         self.dependency = dependency
         self.growth_rate = growth_rate
-        self.pathway_weights = pathway_weights
+        self.pathway_weights = np.asarray(pathway_weights, dtype=np.float32)
+    
+    @property
+    def pathway_weights_dict(self) -> Dict[str, float]:
+        """Pathway weights keyed by protein name."""
+        return dict(zip(PATHWAY_ORDER, self.pathway_weights.tolist()))
     
     def __repr__(self):
         return f"TumorSubtype(name='{self.name}', dependency={self.dependency:.2f})"
@@ -45,48 +56,28 @@ MYCN_AMPLIFIED = TumorSubtype(
     name="MYCN Amplified (High Risk)",
     dependency=DEPENDENCY_HIGH_MYCN,
     growth_rate=BASELINE_GROWTH_RATE * 1.2,  # More aggressive
-    pathway_weights={
-        'MYCN': 0.5,
-        'ALK': 0.2,
-        'AKT': 0.2,
-        'HIF1A': 0.1
-    }
+    pathway_weights=np.array([0.5, 0.2, 0.2, 0.1], dtype=np.float32)  # PATHWAY_ORDER
 )
 
 ALK_MUTATED = TumorSubtype(
     name="ALK Mutated",
     dependency=DEPENDENCY_ALK_MUTATED,
     growth_rate=BASELINE_GROWTH_RATE * 1.1,
-    pathway_weights={
-        'MYCN': 0.2,
-        'ALK': 0.5,
-        'AKT': 0.2,
-        'HIF1A': 0.1
-    }
+    pathway_weights=np.array([0.2, 0.5, 0.2, 0.1], dtype=np.float32)  # PATHWAY_ORDER
 )
 
 ATRX_ALTERED = TumorSubtype(
     name="ATRX Altered",
     dependency=DEPENDENCY_ATRX_ALTERED,
     growth_rate=BASELINE_GROWTH_RATE * 0.9,
-    pathway_weights={
-        'MYCN': 0.2,
-        'ALK': 0.2,
-        'AKT': 0.3,
-        'HIF1A': 0.3
-    }
+    pathway_weights=np.array([0.2, 0.2, 0.3, 0.3], dtype=np.float32)  # PATHWAY_ORDER
 )
 
 LOW_RISK = TumorSubtype(
     name="Low Risk Subtype",
     dependency=DEPENDENCY_LOW_RISK,
     growth_rate=BASELINE_GROWTH_RATE * 0.7,
-    pathway_weights={
-        'MYCN': 0.15,
-        'ALK': 0.15,
-        'AKT': 0.35,
-        'HIF1A': 0.35
-    }
+    pathway_weights=np.array([0.15, 0.15, 0.35, 0.35], dtype=np.float32)  # PATHWAY_ORDER
 )
 
 # Registry of all subtypes
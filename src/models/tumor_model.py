@@ -3,7 +3,7 @@ Tumor growth and apoptosis dynamics model.
 """
 
 import numpy as np
-from typing import List
+from typing import List, Tuple
 from src.utils.parameters import (
     CARRYING_CAPACITY,
     BASE_APOPTOSIS_RATE,
@@ -11,6 +11,7 @@ from src.utils.parameters import (
     APOPTOSIS_MULTIPLIER
 )
 from src.models.subtypes import TumorSubtype
+from src.models.tumor_core import integrate_tumor
 
 
 class TumorModel:
@@ -45,12 +46,14 @@ class TumorModel:
         Returns:
             Growth rate per day
         """
+        volume = self.volume
+        
         # Logistic growth with drug inhibition
-        volume_factor = 1.0 - (self.volume / self.carrying_capacity)
+        volume_factor = 1.0 - (volume / self.carrying_capacity)
         drug_inhibition = 1.0 - drug_effect
         
-        growth = self.growth_rate * self.volume * volume_factor * drug_inhibition
-        return max(0.0, growth)
+        growth = self.growth_rate * volume * volume_factor * drug_inhibition
+        return growth if growth > 0.0 else 0.0
     
     def calculate_apoptosis_rate(
         self,
@@ -72,24 +75,15 @@ class TumorModel:
         """
         base = self.base_apoptosis
         
-        # Apoptosis increase only after delay
-        if time_hours >= APOPTOSIS_DELAY:
-            apoptosis_increase = (
-                self.dependency *
-                drug_effect *
-                APOPTOSIS_MULTIPLIER *
-                self.base_apoptosis
-            )
-        else:
-            # Linear ramp-up during delay period
-            delay_progress = time_hours / APOPTOSIS_DELAY
-            apoptosis_increase = (
-                self.dependency *
-                drug_effect *
-                APOPTOSIS_MULTIPLIER *
-                self.base_apoptosis *
-                delay_progress
-            )
+        # Linear ramp-up during delay period, full increase after delay
+        ramp = time_hours / APOPTOSIS_DELAY if time_hours < APOPTOSIS_DELAY else 1.0
+        apoptosis_increase = (
+            self.dependency *
+            drug_effect *
+            APOPTOSIS_MULTIPLIER *
+            base *
+            ramp
+        )
         
         apoptosis = base + apoptosis_increase
         return apoptosis * self.volume
@@ -113,17 +107,92 @@ class TumorModel:
         Returns:
             New tumor volume in cells
         """
-        growth = self.calculate_growth_rate(drug_effect)
-        apoptosis = self.calculate_apoptosis_rate(drug_effect, time_hours)
+        volume, _, _ = self.step(drug_effect, time_hours, time_step_days)
+        return volume
+    
+    def step(
+        self,
+        drug_effect: float,
+        time_hours: float,
+        time_step_days: float
+    ) -> Tuple[float, float, float]:
+        """
+        Update tumor volume for one time step and return the rates used.
+        
+        Fuses calculate_growth_rate, calculate_apoptosis_rate and the volume
+        update so each rate is computed once per step.
+        
+        Args:
+            drug_effect: Current drug effect (0-1)
+            time_hours: Current time in hours
+            time_step_days: Time step size in days
+            
+        Returns:
+            Tuple of (new volume, growth rate, apoptosis rate), with rates in
+            cells/day evaluated at the volume before the update
+        """
+        volume = self.volume
+        base = self.base_apoptosis
+        
+        # Logistic growth with drug inhibition
+        volume_factor = 1.0 - (volume / self.carrying_capacity)
+        drug_inhibition = 1.0 - drug_effect
+        growth = self.growth_rate * volume * volume_factor * drug_inhibition
+        growth = growth if growth > 0.0 else 0.0
         
-        # Convert apoptosis rate to per-day if needed
-        # (apoptosis is already in cells/day)
+        # Apoptosis with linear ramp-up during delay period
+        ramp = time_hours / APOPTOSIS_DELAY if time_hours < APOPTOSIS_DELAY else 1.0
+        apoptosis_increase = (
+            self.dependency *
+            drug_effect *
+            APOPTOSIS_MULTIPLIER *
+            base *
+            ramp
+        )
+        apoptosis = (base + apoptosis_increase) * volume
         
         # Update volume
         delta_volume = (growth - apoptosis) * time_step_days
-        self.volume = max(0.0, self.volume + delta_volume)
+        volume = volume + delta_volume
+        self.volume = volume if volume > 0.0 else 0.0
+        
+        return self.volume, growth, apoptosis
+    
+    def simulate(
+        self,
+        drug_effects: np.ndarray,
+        time_hours: np.ndarray,
+        time_step_days: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Run update over a full drug effect time course in compiled code.
+        
+        Equivalent to calling step at every time point.
+        
+        Args:
+            drug_effects: Drug effect (0-1) at each time point
+            time_hours: Time points in hours
+            time_step_days: Time step size in days
+            
+        Returns:
+            Tuple of (volumes, growth_rates, apoptosis_rates) arrays
+        """
+        volumes, growth_rates, apoptosis_rates = integrate_tumor(
+            np.ascontiguousarray(drug_effects, dtype=np.float64),
+            np.ascontiguousarray(time_hours, dtype=np.float64),
+            float(time_step_days),
+            float(self.volume),
+            float(self.carrying_capacity),
+            float(self.growth_rate),
+            float(self.base_apoptosis),
+            float(self.dependency),
+            float(APOPTOSIS_MULTIPLIER),
+            float(APOPTOSIS_DELAY)
+        )
+        if len(volumes) > 0:
+            self.volume = volumes[-1]
         
-        return self.volume
+        return volumes, growth_rates, apoptosis_rates
     
     def reset(self):
         """Reset tumor to initial volume."""
@@ -3,7 +3,8 @@ Streamlit dashboard UI components.
 """
 
 import streamlit as st
-from typing import Dict, List, Tuple
+import numpy as np
+from typing import Dict
 from src.models.subtypes import SUBTYPE_REGISTRY
 from src.utils.parameters import (
     PK_17AAG,
@@ -114,8 +115,8 @@ def render_sidebar_controls() -> Dict:
     # Display parameters
     st.sidebar.subheader("Drug Properties")
     st.sidebar.write(f"**{selected_drug_name}**")
-    st.sidebar.write(f"IC50: {selected_drug_pk['ic50']:.1f} nM")
-    st.sidebar.write(f"Half-life: {selected_drug_pk['half_life']:.1f} hours")
+    st.sidebar.write(f"IC50: {selected_drug_pk.ic50:.1f} nM")
+    st.sidebar.write(f"Half-life: {selected_drug_pk.half_life:.1f} hours")
     
     return {
         'subtype': selected_subtype,
@@ -132,14 +133,14 @@ def render_sidebar_controls() -> Dict:
 
 
 def render_main_dashboard(
-    time_days: List[float],
-    time_hours: List[float],
-    volumes: List[float],
-    concentrations: List[float],
-    drug_effects: List[float],
-    protein_levels: Dict[str, List[float]],
-    growth_rates: List[float],
-    apoptosis_rates: List[float],
+    time_days: np.ndarray,
+    time_hours: np.ndarray,
+    volumes: np.ndarray,
+    concentrations: np.ndarray,
+    drug_effects: np.ndarray,
+    protein_levels: Dict[str, np.ndarray],
+    growth_rates: np.ndarray,
+    apoptosis_rates: np.ndarray,
     parameters: Dict,
     show_protein_stability: bool = True
 ):
@@ -161,6 +162,7 @@ def render_main_dashboard(
     from src.utils.plotting import (
         plot_tumor_volume,
         plot_drug_concentration,
+        plot_drug_effect,
         plot_protein_stability,
         plot_dynamics,
         plot_comprehensive_dashboard
@@ -182,7 +184,7 @@ def render_main_dashboard(
     with col3:
         st.metric("Volume Change", f"{volume_change:+.1f}%")
     with col4:
-        max_effect = max(drug_effects) if drug_effects else 0.0
+        max_effect = float(np.max(drug_effects)) if len(drug_effects) else 0.0
         st.metric("Peak Drug Effect", f"{max_effect:.2%}")
     
     # Main plots
@@ -207,23 +209,10 @@ def render_main_dashboard(
         st.plotly_chart(fig_conc, use_container_width=True)
     
     with col2:
-        from plotly import graph_objects as go
-        fig_effect = go.Figure()
-        fig_effect.add_trace(go.Scatter(
-            x=time_hours,
-            y=drug_effects,
-            mode='lines',
-            name='Drug Effect',
-            line=dict(color='#9b59b6', width=2),
-            fill='tozeroy',
-            hovertemplate='Effect: %{y:.3f}<extra></extra>'
-        ))
-        fig_effect.update_layout(
-            title="Drug Effect Over Time",
-            xaxis_title='Time (hours)',
-            yaxis_title='Effect (0-1)',
-            template='plotly_white',
-            height=400
+        fig_effect = plot_drug_effect(
+            time_hours,
+            drug_effects,
+            title="Drug Effect Over Time"
         )
         st.plotly_chart(fig_effect, use_container_width=True)
     
@@ -260,3 +249,76 @@ def render_main_dashboard(
         )
         st.plotly_chart(fig_comprehensive, use_container_width=True)
 
+
+def render_sweep_controls() -> Dict:
+    """
+    Render parameter sweep controls and return the sweep grid.
+    
+    Returns:
+        Dictionary with 'doses' and 'intervals' tuples to sweep
+    """
+    st.subheader("Sweep Settings")
+    st.caption(
+        "Sweeps dose and dosing interval for the subtype, drug and "
+        "simulation settings selected in the sidebar."
+    )
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        dose_range = st.slider(
+            "Dose Range (nM)",
+            min_value=10.0,
+            max_value=500.0,
+            value=(50.0, 300.0),
+            step=10.0
+        )
+        num_doses = st.slider(
+            "Number of Doses",
+            min_value=2,
+            max_value=30,
+            value=10
+        )
+    with col2:
+        intervals = st.multiselect(
+            "Dosing Intervals (hours)",
+            [6.0, 12.0, 18.0, 24.0, 30.0, 36.0, 42.0, 48.0],
+            default=[12.0, 24.0, 48.0]
+        )
+    
+    doses = np.linspace(dose_range[0], dose_range[1], num_doses)
+    
+    return {
+        'doses': tuple(float(d) for d in doses),
+        'intervals': tuple(sorted(intervals))
+    }
+
+
+def render_sweep_results(
+    doses: np.ndarray,
+    intervals: np.ndarray,
+    final_volumes: np.ndarray,
+    parameters: Dict
+):
+    """
+    Render parameter sweep results.
+    
+    Args:
+        doses: Swept doses (nM)
+        intervals: Swept dosing intervals (hours)
+        final_volumes: Final tumor volumes (cells), shape (doses, intervals)
+        parameters: Simulation parameters
+    """
+    from src.utils.plotting import plot_sweep_heatmap
+    
+    if final_volumes.size == 0:
+        st.info("Select at least one dosing interval to run a sweep.")
+        return
+    
+    fig_sweep = plot_sweep_heatmap(
+        doses,
+        intervals,
+        final_volumes,
+        title=f"Final Tumor Volume - {parameters['subtype_name']}, "
+              f"{parameters['drug_name']}"
+    )
+    st.plotly_chart(fig_sweep, use_container_width=True)
@@ -1,15 +1,188 @@
 """
 Plotting utilities for simulation visualization.
+
+Series arguments are NumPy arrays; lists are accepted and converted once
+on entry, so pass arrays to avoid the extra copy.
 """
 
+import copy
+import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from src.utils.parameters import PROTEIN_ORDER
+
+# Serialize figures with orjson, which encodes ndarrays directly
+pio.json.config.default_engine = 'orjson'
+
+# Layout template, resolved once rather than by name on every figure
+_TEMPLATE = pio.templates['plotly_white']
+
+# Trace colors; protein colors follow PROTEIN_ORDER
+_COLOR_TUMOR = '#e74c3c'
+_COLOR_DRUG = '#3498db'
+_COLOR_EFFECT = '#9b59b6'
+_COLOR_GROWTH = '#27ae60'
+_COLOR_CHANGE = '#f39c12'
+_PROTEIN_COLORS = ('#9b59b6', '#e67e22', '#16a085', '#c0392b')
+
+# Line styles shared across figures (plotly copies them into each trace)
+_LINE_TUMOR = dict(color=_COLOR_TUMOR, width=2)
+_LINE_DRUG = dict(color=_COLOR_DRUG, width=2)
+_LINE_EFFECT = dict(color=_COLOR_EFFECT, width=2)
+_LINE_GROWTH = dict(color=_COLOR_GROWTH, width=2)
+_LINE_APOPTOSIS = dict(color=_COLOR_TUMOR, width=2)
+_PROTEIN_LINES = tuple(dict(color=c, width=2) for c in _PROTEIN_COLORS)
+
+# Thinner default-width lines for the comprehensive dashboard subplots
+_SUBPLOT_LINE_TUMOR = dict(color=_COLOR_TUMOR)
+_SUBPLOT_LINE_DRUG = dict(color=_COLOR_DRUG)
+_SUBPLOT_LINE_EFFECT = dict(color=_COLOR_EFFECT)
+_SUBPLOT_LINE_EFFECT_DASHED = dict(color=_COLOR_EFFECT, dash='dash')
+_SUBPLOT_LINE_GROWTH = dict(color=_COLOR_GROWTH)
+_SUBPLOT_LINE_CHANGE = dict(color=_COLOR_CHANGE)
+_SUBPLOT_PROTEIN_LINES = tuple(dict(color=c) for c in _PROTEIN_COLORS)
+
+# Hover text per trace
+_HOVER_VOLUME = 'Day: %{x:.1f}<br>Volume: %{y:.2f} mm³<extra></extra>'
+_HOVER_CONCENTRATION = 'Time: %{x:.1f} h<br>Concentration: %{y:.2f} nM<extra></extra>'
+_HOVER_EFFECT = 'Effect: %{y:.3f}<extra></extra>'
+_HOVER_GROWTH = 'Growth: %{y:.2f} M cells/day<extra></extra>'
+_HOVER_APOPTOSIS = 'Apoptosis: %{y:.2f} M cells/day<extra></extra>'
+_HOVER_PROTEIN = {p: f'{p}: %{{y:.3f}}<extra></extra>' for p in PROTEIN_ORDER}
+_HOVER_SWEEP = (
+    'Interval: %{x:.0f} h<br>Dose: %{y:.0f} nM<br>'
+    'Volume: %{z:.2f} mm³<extra></extra>'
+)
+
+# Traces with more points than this render with WebGL instead of SVG
+WEBGL_THRESHOLD = 1000
+
+# Series longer than this are downsampled with LTTB before plotting; the
+# figures cannot resolve more points than this anyway
+LTTB_TARGET = 2000
+
+# Comprehensive dashboard layout (subplot grid, axis titles, styling),
+# generated once. Axis names follow make_subplots numbering: subplots are
+# x/y through x6/y7 row by row, and the secondary y axis of (1, 2) is y3.
+_SUBPLOT_TITLES = (
+    'Tumor Volume',
+    'Drug Concentration & Effect',
+    'Protein Stability',
+    'Growth vs Apoptosis',
+    'Drug Effect Over Time',
+    'Volume Change Rate'
+)
+_SPECS = (({"secondary_y": False}, {"secondary_y": True}),
+          ({"secondary_y": False}, {"secondary_y": False}),
+          ({"secondary_y": False}, {"secondary_y": False}))
+_DASHBOARD_LAYOUT = make_subplots(
+    rows=3, cols=2,
+    subplot_titles=_SUBPLOT_TITLES,
+    specs=_SPECS
+).update_layout(
+    xaxis=dict(title_text="Time (days)"),
+    xaxis2=dict(title_text="Time (hours)"),
+    xaxis3=dict(title_text="Time (hours)"),
+    xaxis4=dict(title_text="Time (days)"),
+    xaxis5=dict(title_text="Time (hours)"),
+    xaxis6=dict(title_text="Time (days)"),
+    yaxis=dict(title_text="Volume (mm³)"),
+    yaxis2=dict(title_text="Concentration (nM)"),
+    yaxis3=dict(title_text="Effect"),
+    yaxis4=dict(title_text="Stability"),
+    yaxis5=dict(title_text="Rate (M cells/day)"),
+    yaxis6=dict(title_text="Effect"),
+    yaxis7=dict(title_text="Change (M cells/day)"),
+    height=1200,
+    template=_TEMPLATE,
+    showlegend=True
+).layout.to_plotly_json()
+
+# Comprehensive dashboard traces, each naming its subplot axes directly
+_DASHBOARD_TRACE_STYLES = (
+    dict(name='Volume (mm³)', line=_SUBPLOT_LINE_TUMOR, xaxis='x', yaxis='y'),
+    dict(name='Concentration (nM)', line=_SUBPLOT_LINE_DRUG, xaxis='x2', yaxis='y2'),
+    dict(name='Effect', line=_SUBPLOT_LINE_EFFECT_DASHED, xaxis='x2', yaxis='y3'),
+    *(
+        dict(name=protein, line=line, xaxis='x3', yaxis='y4')
+        for protein, line in zip(PROTEIN_ORDER, _SUBPLOT_PROTEIN_LINES)
+    ),
+    dict(name='Growth (M cells/day)', line=_SUBPLOT_LINE_GROWTH, xaxis='x4', yaxis='y5'),
+    dict(name='Apoptosis (M cells/day)', line=_SUBPLOT_LINE_TUMOR, xaxis='x4', yaxis='y5'),
+    dict(name='Drug Effect', line=_SUBPLOT_LINE_EFFECT, fill='tozeroy', xaxis='x5', yaxis='y6'),
+    dict(name='Volume Change (M cells/day)', line=_SUBPLOT_LINE_CHANGE, xaxis='x6', yaxis='y7'),
+)
+
+
+def _scatter_type(x) -> type:
+    """Return the scatter trace class to use for a series of len(x) points."""
+    return go.Scattergl if len(x) > WEBGL_THRESHOLD else go.Scatter
+
+
+def _to_millions(values) -> np.ndarray:
+    """
+    Convert cells (or cells/day) to millions, i.e. mm³, for display.
+    
+    Scaled in float64 and then quantized to float32, which is far finer
+    than the plots can show and halves the serialized size.
+    """
+    return (np.asarray(values, dtype=np.float64) * 1e-6).astype(np.float32)
+
+
+def _lttb(x, y, target: int = LTTB_TARGET) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample a series with Largest-Triangle-Three-Buckets.
+    
+    Keeps the first and last points and, from each of target - 2 equal
+    buckets in between, the point forming the largest triangle with the
+    previously kept point and the mean of the next bucket. Peaks and
+    troughs survive, so the curve looks the same at screen resolution.
+    
+    Args:
+        x: Series x values
+        y: Series y values
+        target: Number of points to keep
+        
+    Returns:
+        Tuple of (x, y) arrays, unchanged if there are target points or fewer
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(y)
+    if n <= target or target < 3:
+        return x, y
+    
+    # Buckets [edges[b], edges[b + 1]) split the interior points 1..n-2
+    edges = np.linspace(1, n - 1, target - 1).astype(np.intp)
+    counts = np.diff(edges)
+    
+    # Mean of each bucket; the last point stands in for the bucket after the last
+    starts = edges[:-1] - 1
+    mean_x = np.append(np.add.reduceat(x[1:-1], starts, dtype=np.float64) / counts, x[-1])
+    mean_y = np.append(np.add.reduceat(y[1:-1], starts, dtype=np.float64) / counts, y[-1])
+    
+    keep = np.empty(target, dtype=np.intp)
+    keep[0] = 0
+    keep[-1] = n - 1
+    a = 0
+    for b in range(target - 2):
+        lo, hi = edges[b], edges[b + 1]
+        xa, ya = float(x[a]), float(y[a])
+        area = np.abs(
+            (xa - mean_x[b + 1]) * (y[lo:hi] - ya)
+            - (xa - x[lo:hi]) * (mean_y[b + 1] - ya)
+        )
+        a = lo + int(np.argmax(area))
+        keep[b + 1] = a
+    
+    return x[keep], y[keep]
 
 
 def plot_tumor_volume(
-    time_days: List[float],
-    volumes: List[float],
+    time_days: np.ndarray,
+    volumes: np.ndarray,
     title: str = "Tumor Volume Over Time"
 ) -> go.Figure:
     """
@@ -23,18 +196,23 @@ def plot_tumor_volume(
     Returns:
         Plotly figure
     """
+    time_days = np.asarray(time_days)
+    volumes = np.asarray(volumes)
+    
     fig = go.Figure()
+    Scatter = _scatter_type(time_days)
     
     # Convert to mm³ for display
-    volumes_mm3 = [v / 1e6 for v in volumes]
+    volumes_mm3 = _to_millions(volumes)
+    x, y = _lttb(time_days, volumes_mm3)
     
-    fig.add_trace(go.Scatter(
-        x=time_days,
-        y=volumes_mm3,
+    fig.add_trace(Scatter(
+        x=x,
+        y=y,
         mode='lines',
         name='Tumor Volume',
-        line=dict(color='#e74c3c', width=2),
-        hovertemplate='Day: %{x:.1f}<br>Volume: %{y:.2f} mm³<extra></extra>'
+        line=_LINE_TUMOR,
+        hovertemplate=_HOVER_VOLUME
     ))
     
     fig.update_layout(
@@ -42,7 +220,7 @@ def plot_tumor_volume(
         xaxis_title='Time (days)',
         yaxis_title='Tumor Volume (mm³)',
         hovermode='x unified',
-        template='plotly_white',
+        template=_TEMPLATE,
         height=400
     )
     
@@ -50,8 +228,8 @@ def plot_tumor_volume(
 
 
 def plot_drug_concentration(
-    time_hours: List[float],
-    concentrations: List[float],
+    time_hours: np.ndarray,
+    concentrations: np.ndarray,
     drug_name: str = "Drug",
     title: str = "Drug Concentration Over Time"
 ) -> go.Figure:
@@ -67,16 +245,21 @@ def plot_drug_concentration(
     Returns:
         Plotly figure
     """
+    time_hours = np.asarray(time_hours)
+    concentrations = np.asarray(concentrations)
+    
     fig = go.Figure()
+    Scatter = _scatter_type(time_hours)
+    x, y = _lttb(time_hours, concentrations)
     
-    fig.add_trace(go.Scatter(
-        x=time_hours,
-        y=concentrations,
+    fig.add_trace(Scatter(
+        x=x,
+        y=y,
         mode='lines',
         name=f'{drug_name} Concentration',
-        line=dict(color='#3498db', width=2),
+        line=_LINE_DRUG,
         fill='tozeroy',
-        hovertemplate='Time: %{x:.1f} h<br>Concentration: %{y:.2f} nM<extra></extra>'
+        hovertemplate=_HOVER_CONCENTRATION
     ))
     
     fig.update_layout(
@@ -84,7 +267,51 @@ def plot_drug_concentration(
         xaxis_title='Time (hours)',
         yaxis_title='Concentration (nM)',
         hovermode='x unified',
-        template='plotly_white',
+        template=_TEMPLATE,
+        height=400
+    )
+    
+    return fig
+
+
+def plot_drug_effect(
+    time_hours: np.ndarray,
+    drug_effects: np.ndarray,
+    title: str = "Drug Effect Over Time"
+) -> go.Figure:
+    """
+    Plot drug effect over time.
+    
+    Args:
+        time_hours: Time points in hours
+        drug_effects: Drug effects (0-1)
+        title: Plot title
+        
+    Returns:
+        Plotly figure
+    """
+    time_hours = np.asarray(time_hours)
+    drug_effects = np.asarray(drug_effects)
+    
+    fig = go.Figure()
+    Scatter = _scatter_type(time_hours)
+    x, y = _lttb(time_hours, drug_effects)
+    
+    fig.add_trace(Scatter(
+        x=x,
+        y=y,
+        mode='lines',
+        name='Drug Effect',
+        line=_LINE_EFFECT,
+        fill='tozeroy',
+        hovertemplate=_HOVER_EFFECT
+    ))
+    
+    fig.update_layout(
+        title=title,
+        xaxis_title='Time (hours)',
+        yaxis_title='Effect (0-1)',
+        template=_TEMPLATE,
         height=400
     )
     
@@ -92,8 +319,8 @@ def plot_drug_concentration(
 
 
 def plot_protein_stability(
-    time_hours: List[float],
-    protein_levels: Dict[str, List[float]],
+    time_hours: np.ndarray,
+    protein_levels: Dict[str, np.ndarray],
     title: str = "Oncogenic Protein Stability"
 ) -> go.Figure:
     """
@@ -107,26 +334,38 @@ def plot_protein_stability(
     Returns:
         Plotly figure
     """
+    time_hours = np.asarray(time_hours)
+    protein_levels = {
+        protein: np.asarray(protein_levels[protein]) for protein in PROTEIN_ORDER
+    }
+    
     fig = go.Figure()
+    Scatter = _scatter_type(time_hours)
     
-    colors = ['#9b59b6', '#e67e22', '#16a085', '#c0392b']
+    # Protein series share one length, so a single zero-copy view of the
+    # time axis serves every trace
+    protein_time = time_hours[:len(protein_levels[PROTEIN_ORDER[0]])]
     
-    for i, (protein, levels) in enumerate(protein_levels.items()):
-        fig.add_trace(go.Scatter(
-            x=time_hours[:len(levels)],
-            y=levels,
+    # Add all protein traces in one call
+    traces = []
+    for protein, line in zip(PROTEIN_ORDER, _PROTEIN_LINES):
+        x, y = _lttb(protein_time, protein_levels[protein])
+        traces.append(Scatter(
+            x=x,
+            y=y,
             mode='lines',
             name=protein,
-            line=dict(color=colors[i % len(colors)], width=2),
-            hovertemplate=f'{protein}: %{{y:.3f}}<extra></extra>'
+            line=line,
+            hovertemplate=_HOVER_PROTEIN[protein]
         ))
+    fig.add_traces(traces)
     
     fig.update_layout(
         title=title,
         xaxis_title='Time (hours)',
         yaxis_title='Relative Stability',
         hovermode='x unified',
-        template='plotly_white',
+        template=_TEMPLATE,
         height=400,
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
     )
@@ -135,9 +374,9 @@ def plot_protein_stability(
 
 
 def plot_dynamics(
-    time_days: List[float],
-    growth_rates: List[float],
-    apoptosis_rates: List[float],
+    time_days: np.ndarray,
+    growth_rates: np.ndarray,
+    apoptosis_rates: np.ndarray,
     title: str = "Growth vs Apoptosis Dynamics"
 ) -> go.Figure:
     """
@@ -152,24 +391,29 @@ def plot_dynamics(
     Returns:
         Plotly figure
     """
+    time_days = np.asarray(time_days)
+    
     fig = go.Figure()
+    Scatter = _scatter_type(time_days)
     
-    fig.add_trace(go.Scatter(
-        x=time_days,
-        y=[g / 1e6 for g in growth_rates],  # Convert to millions
+    x, y = _lttb(time_days, _to_millions(growth_rates))
+    fig.add_trace(Scatter(
+        x=x,
+        y=y,
         mode='lines',
         name='Growth Rate',
-        line=dict(color='#27ae60', width=2),
-        hovertemplate='Growth: %{y:.2f} M cells/day<extra></extra>'
+        line=_LINE_GROWTH,
+        hovertemplate=_HOVER_GROWTH
     ))
     
-    fig.add_trace(go.Scatter(
-        x=time_days,
-        y=[a / 1e6 for a in apoptosis_rates],  # Convert to millions
+    x, y = _lttb(time_days, _to_millions(apoptosis_rates))
+    fig.add_trace(Scatter(
+        x=x,
+        y=y,
         mode='lines',
         name='Apoptosis Rate',
-        line=dict(color='#e74c3c', width=2),
-        hovertemplate='Apoptosis: %{y:.2f} M cells/day<extra></extra>'
+        line=_LINE_APOPTOSIS,
+        hovertemplate=_HOVER_APOPTOSIS
     ))
     
     fig.update_layout(
@@ -177,22 +421,65 @@ def plot_dynamics(
         xaxis_title='Time (days)',
         yaxis_title='Rate (M cells/day)',
         hovermode='x unified',
-        template='plotly_white',
+        template=_TEMPLATE,
         height=400
     )
     
     return fig
 
 
+def _dashboard_series(
+    time_days: np.ndarray,
+    time_hours: np.ndarray,
+    volumes: np.ndarray,
+    concentrations: np.ndarray,
+    drug_effects: np.ndarray,
+    protein_levels: Dict[str, np.ndarray],
+    growth_rates: np.ndarray,
+    apoptosis_rates: np.ndarray
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Compute the (x, y) data of each comprehensive dashboard trace.
+    
+    Series are converted to display units and downsampled, in the order
+    of _DASHBOARD_TRACE_STYLES.
+    """
+    time_days = np.asarray(time_days)
+    time_hours = np.asarray(time_hours)
+    volumes = np.asarray(volumes)
+    concentrations = np.asarray(concentrations)
+    drug_effects = np.asarray(drug_effects)
+    
+    # Protein Stability, all plotted against one view of the time axis
+    protein_time = time_hours[:len(protein_levels[PROTEIN_ORDER[0]])]
+    
+    # Volume Change Rate, differenced in float64
+    volume_changes = _to_millions(
+        np.diff(volumes.astype(np.float64)) / np.diff(time_days.astype(np.float64))
+    )
+    
+    effect = _lttb(time_hours, drug_effects)
+    return [
+        _lttb(time_days, _to_millions(volumes)),
+        _lttb(time_hours, concentrations),
+        effect,
+        *(_lttb(protein_time, protein_levels[protein]) for protein in PROTEIN_ORDER),
+        _lttb(time_days, _to_millions(growth_rates)),
+        _lttb(time_days, _to_millions(apoptosis_rates)),
+        effect,
+        _lttb(time_days[1:], volume_changes)
+    ]
+
+
 def plot_comprehensive_dashboard(
-    time_days: List[float],
-    time_hours: List[float],
-    volumes: List[float],
-    concentrations: List[float],
-    drug_effects: List[float],
-    protein_levels: Dict[str, List[float]],
-    growth_rates: List[float],
-    apoptosis_rates: List[float],
+    time_days: np.ndarray,
+    time_hours: np.ndarray,
+    volumes: np.ndarray,
+    concentrations: np.ndarray,
+    drug_effects: np.ndarray,
+    protein_levels: Dict[str, np.ndarray],
+    growth_rates: np.ndarray,
+    apoptosis_rates: np.ndarray,
     drug_name: str = "Drug"
 ) -> go.Figure:
     """
@@ -212,102 +499,154 @@ def plot_comprehensive_dashboard(
     Returns:
         Plotly figure with subplots
     """
-    fig = make_subplots(
-        rows=3, cols=2,
-        subplot_titles=(
-            'Tumor Volume',
-            'Drug Concentration & Effect',
-            'Protein Stability',
-            'Growth vs Apoptosis',
-            'Drug Effect Over Time',
-            'Volume Change Rate'
-        ),
-        specs=[[{"secondary_y": False}, {"secondary_y": True}],
-               [{"secondary_y": False}, {"secondary_y": False}],
-               [{"secondary_y": False}, {"secondary_y": False}]]
+    Scatter = _scatter_type(time_hours)
+    series = _dashboard_series(
+        time_days,
+        time_hours,
+        volumes,
+        concentrations,
+        drug_effects,
+        protein_levels,
+        growth_rates,
+        apoptosis_rates
     )
+    traces = [
+        Scatter(x=x, y=y, **style)
+        for (x, y), style in zip(series, _DASHBOARD_TRACE_STYLES)
+    ]
     
-    # Tumor Volume
-    volumes_mm3 = [v / 1e6 for v in volumes]
-    fig.add_trace(
-        go.Scatter(x=time_days, y=volumes_mm3, name='Volume (mm³)',
-                  line=dict(color='#e74c3c')),
-        row=1, col=1
+    # Traces and the shared layout were each validated on construction, so
+    # build the figure in one shot without re-validating them
+    fig = go.Figure(
+        data=traces,
+        layout=copy.deepcopy(_DASHBOARD_LAYOUT),
+        _validate=False
     )
-    
-    # Drug Concentration & Effect
-    fig.add_trace(
-        go.Scatter(x=time_hours, y=concentrations, name='Concentration (nM)',
-                  line=dict(color='#3498db')),
-        row=1, col=2, secondary_y=False
-    )
-    fig.add_trace(
-        go.Scatter(x=time_hours, y=drug_effects, name='Effect',
-                  line=dict(color='#9b59b6', dash='dash')),
-        row=1, col=2, secondary_y=True
+    fig.update_layout(
+        title_text=f"Neuroblastoma HSP90 Inhibitor Simulation - {drug_name}"
     )
     
-    # Protein Stability
-    colors = ['#9b59b6', '#e67e22', '#16a085', '#c0392b']
-    for i, (protein, levels) in enumerate(protein_levels.items()):
-        fig.add_trace(
-            go.Scatter(x=time_hours[:len(levels)], y=levels, name=protein,
-                      line=dict(color=colors[i % len(colors)])),
-            row=2, col=1
-        )
+    return fig
+
+
+def make_dashboard_widget(
+    time_days: np.ndarray,
+    time_hours: np.ndarray,
+    volumes: np.ndarray,
+    concentrations: np.ndarray,
+    drug_effects: np.ndarray,
+    protein_levels: Dict[str, np.ndarray],
+    growth_rates: np.ndarray,
+    apoptosis_rates: np.ndarray,
+    drug_name: str = "Drug"
+) -> go.FigureWidget:
+    """
+    Create the comprehensive dashboard as an interactive widget.
     
-    # Growth vs Apoptosis
-    fig.add_trace(
-        go.Scatter(x=time_days, y=[g / 1e6 for g in growth_rates],
-                  name='Growth (M cells/day)', line=dict(color='#27ae60')),
-        row=2, col=2
-    )
-    fig.add_trace(
-        go.Scatter(x=time_days, y=[a / 1e6 for a in apoptosis_rates],
-                  name='Apoptosis (M cells/day)', line=dict(color='#e74c3c')),
-        row=2, col=2
-    )
+    For notebooks, where the widget is displayed once and refreshed in
+    place with update_dashboard. Requires anywidget (plotly 6 and newer)
+    or ipywidgets (plotly 5).
     
-    # Drug Effect
-    fig.add_trace(
-        go.Scatter(x=time_hours, y=drug_effects, name='Drug Effect',
-                  line=dict(color='#9b59b6'), fill='tozeroy'),
-        row=3, col=1
-    )
+    Args:
+        Same as plot_comprehensive_dashboard
+        
+    Returns:
+        Plotly FigureWidget with subplots
+    """
+    return go.FigureWidget(plot_comprehensive_dashboard(
+        time_days,
+        time_hours,
+        volumes,
+        concentrations,
+        drug_effects,
+        protein_levels,
+        growth_rates,
+        apoptosis_rates,
+        drug_name=drug_name
+    ))
+
+
+def update_dashboard(
+    fig: go.FigureWidget,
+    time_days: np.ndarray,
+    time_hours: np.ndarray,
+    volumes: np.ndarray,
+    concentrations: np.ndarray,
+    drug_effects: np.ndarray,
+    protein_levels: Dict[str, np.ndarray],
+    growth_rates: np.ndarray,
+    apoptosis_rates: np.ndarray,
+    drug_name: str = "Drug"
+) -> None:
+    """
+    Replace the data of a dashboard from make_dashboard_widget in place.
     
-    # Volume Change Rate
-    volume_changes = []
-    for i in range(1, len(volumes)):
-        change = (volumes[i] - volumes[i-1]) / (time_days[i] - time_days[i-1])
-        volume_changes.append(change / 1e6)
-    fig.add_trace(
-        go.Scatter(x=time_days[1:], y=volume_changes,
-                  name='Volume Change (M cells/day)', line=dict(color='#f39c12')),
-        row=3, col=2
+    All trace and title changes are sent to the frontend as one batch, so
+    the widget repaints once.
+    
+    Args:
+        fig: Dashboard widget to update
+        Remaining arguments as for plot_comprehensive_dashboard
+    """
+    series = _dashboard_series(
+        time_days,
+        time_hours,
+        volumes,
+        concentrations,
+        drug_effects,
+        protein_levels,
+        growth_rates,
+        apoptosis_rates
     )
     
-    # Update axes
-    fig.update_xaxes(title_text="Time (days)", row=1, col=1)
-    fig.update_xaxes(title_text="Time (hours)", row=1, col=2)
-    fig.update_xaxes(title_text="Time (hours)", row=2, col=1)
-    fig.update_xaxes(title_text="Time (days)", row=2, col=2)
-    fig.update_xaxes(title_text="Time (hours)", row=3, col=1)
-    fig.update_xaxes(title_text="Time (days)", row=3, col=2)
-    
-    fig.update_yaxes(title_text="Volume (mm³)", row=1, col=1)
-    fig.update_yaxes(title_text="Concentration (nM)", row=1, col=2)
-    fig.update_yaxes(title_text="Effect", row=1, col=2, secondary_y=True)
-    fig.update_yaxes(title_text="Stability", row=2, col=1)
-    fig.update_yaxes(title_text="Rate (M cells/day)", row=2, col=2)
-    fig.update_yaxes(title_text="Effect", row=3, col=1)
-    fig.update_yaxes(title_text="Change (M cells/day)", row=3, col=2)
+    with fig.batch_update():
+        for trace, (x, y) in zip(fig.data, series):
+            trace.x = x
+            trace.y = y
+        fig.layout.title.text = (
+            f"Neuroblastoma HSP90 Inhibitor Simulation - {drug_name}"
+        )
+
+
+def plot_sweep_heatmap(
+    doses: np.ndarray,
+    intervals: np.ndarray,
+    final_volumes: np.ndarray,
+    title: str = "Final Tumor Volume by Dosing Regimen"
+) -> go.Figure:
+    """
+    Plot final tumor volume across a dose x dosing interval grid.
+    
+    Args:
+        doses: Swept doses in nM
+        intervals: Swept dosing intervals in hours
+        final_volumes: Final tumor volumes in cells, shape (doses, intervals)
+        title: Plot title
+        
+    Returns:
+        Plotly figure
+    """
+    doses = np.asarray(doses)
+    intervals = np.asarray(intervals)
+    
+    fig = go.Figure()
+    
+    # Convert to mm³ for display, intervals on x and doses on y
+    fig.add_trace(go.Heatmap(
+        x=intervals,
+        y=doses,
+        z=_to_millions(final_volumes),
+        colorscale='RdYlGn_r',
+        colorbar=dict(title='Volume (mm³)'),
+        hovertemplate=_HOVER_SWEEP
+    ))
     
     fig.update_layout(
-        height=1200,
-        title_text=f"Neuroblastoma HSP90 Inhibitor Simulation - {drug_name}",
-        template='plotly_white',
-        showlegend=True
+        title=title,
+        xaxis_title='Dosing Interval (hours)',
+        yaxis_title='Dose (nM)',
+        template=_TEMPLATE,
+        height=500
     )
     
     return fig
-